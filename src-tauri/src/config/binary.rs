@@ -7,6 +7,15 @@ const STORED_AXIS_CONFIG_SIZE: usize = 15;
 const MAX_PIN_MAP_COUNT: u8 = 32;
 const MAX_LOGICAL_INPUT_COUNT: u8 = 64;
 
+// Firmware enum names, indexed directly by the raw stored byte
+const AXIS_CURVE_NAMES: [&str; 4] = ["linear", "curve1", "curve2", "curve3"];
+// enum ButtonBehavior { NORMAL=0, MOMENTARY=1, ENC_A=2, ENC_B=3 }
+const BUTTON_BEHAVIOR_NAMES: [&str; 4] = ["normal", "momentary", "encoder_a", "encoder_b"];
+// enum InputType { INPUT_PIN=0, INPUT_MATRIX=1, INPUT_SHIFTREG=2 }
+const INPUT_TYPE_NAMES: [&str; 3] = ["Pin", "Matrix", "Shift Register"];
+// enum PinType { PIN_UNUSED=0, BTN=1, BTN_ROW=2, BTN_COL=3, SHIFTREG_PL=4, SHIFTREG_CLK=5, SHIFTREG_QH=6 }
+const PIN_TYPE_NAMES: [&str; 7] = ["PIN_UNUSED", "BTN", "BTN_ROW", "BTN_COL", "SHIFTREG_PL", "SHIFTREG_CLK", "SHIFTREG_QH"];
+
 #[cfg(test)]
 fn calculate_crc32(data: &[u8]) -> u32 { let mut checksum: u32 = 0xFFFFFFFF; for &byte in data { checksum = crc32_update_byte(checksum, byte); } !checksum }
 #[cfg(not(test))]
@@ -124,6 +133,10 @@ pub struct StoredLogicalInput {
     pub data: [u8; 2], // Changed from [u8; 4] to match firmware
 }
 
+// Record sizes resolved once at compile time and shared by the serializer and parser
+const PIN_MAP_ENTRY_SIZE: usize = std::mem::size_of::<StoredPinMapEntry>();
+const LOGICAL_INPUT_SIZE: usize = std::mem::size_of::<StoredLogicalInput>();
+
 #[repr(C, packed)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct StoredConfig {
@@ -136,6 +149,8 @@ pub struct StoredConfig {
     pub axes: [StoredAxisConfig; 8], // Fixed array of 8 axes
 }
 
+const STORED_CONFIG_SIZE: usize = std::mem::size_of::<StoredConfig>();
+
 impl StoredConfig {
     pub fn new() -> Self {
         Self {
@@ -185,25 +200,25 @@ impl BinaryConfig {
 
     /// Serialize to binary format matching firmware expectations
     pub fn to_bytes(&self) -> Result<Vec<u8>, String> {
-        let mut buffer = Vec::new();
-
         // First pass: serialize without checksum to calculate size
         let mut temp_config = self.stored_config.clone();
         temp_config.header.checksum = 0;
         
         // Calculate total size
-        let fixed_size = std::mem::size_of::<StoredConfig>();
-        let pin_map_size = self.pin_map_entries.len() * std::mem::size_of::<StoredPinMapEntry>();
-        let logical_inputs_size = self.logical_inputs.len() * std::mem::size_of::<StoredLogicalInput>();
-        let total_size = fixed_size + pin_map_size + logical_inputs_size;
+        let pin_map_size = self.pin_map_entries.len() * PIN_MAP_ENTRY_SIZE;
+        let logical_inputs_size = self.logical_inputs.len() * LOGICAL_INPUT_SIZE;
+        let total_size = STORED_CONFIG_SIZE + pin_map_size + logical_inputs_size;
         
         temp_config.header.size = total_size as u16;
 
+        // Size is known up front, so allocate the output exactly once
+        let mut buffer = Vec::with_capacity(total_size);
+
         // Serialize fixed portion
         let config_bytes = unsafe {
             std::slice::from_raw_parts(
                 &temp_config as *const StoredConfig as *const u8,
-                fixed_size
+                STORED_CONFIG_SIZE
             )
         };
         buffer.extend_from_slice(config_bytes);
@@ -213,7 +228,7 @@ impl BinaryConfig {
             let entry_bytes = unsafe {
                 std::slice::from_raw_parts(
                     entry as *const StoredPinMapEntry as *const u8,
-                    std::mem::size_of::<StoredPinMapEntry>()
+                    PIN_MAP_ENTRY_SIZE
                 )
             };
             buffer.extend_from_slice(entry_bytes);
@@ -223,7 +238,7 @@ impl BinaryConfig {
             let input_bytes = unsafe {
                 std::slice::from_raw_parts(
                     input as *const StoredLogicalInput as *const u8,
-                    std::mem::size_of::<StoredLogicalInput>()
+                    LOGICAL_INPUT_SIZE
                 )
             };
             buffer.extend_from_slice(input_bytes);
@@ -239,7 +254,7 @@ impl BinaryConfig {
 
     /// Parse from binary data
     pub fn from_bytes(data: &[u8]) -> Result<Self, String> {
-        if data.len() < std::mem::size_of::<StoredConfig>() {
+        if data.len() < STORED_CONFIG_SIZE {
             return Err("Data too small for StoredConfig".to_string());
         }
 
@@ -253,6 +268,15 @@ impl BinaryConfig {
         stored_config.header.validate()?;
         stored_config.validate_counts()?;
 
+        // Derive every section boundary once from the counts and validate them up front,
+        // before spending a CRC pass on a payload that cannot hold the declared records
+        let pin_map_end = STORED_CONFIG_SIZE + stored_config.pin_map_count as usize * PIN_MAP_ENTRY_SIZE;
+        let logical_inputs_end = pin_map_end + stored_config.logical_input_count as usize * LOGICAL_INPUT_SIZE;
+        if logical_inputs_end > data.len() {
+            return Err(format!("Insufficient data for pin map entries and logical inputs: need {} bytes, got {}",
+                logical_inputs_end, data.len()));
+        }
+
         // Verify size
         let header_size = stored_config.header.size;
         if data.len() != header_size as usize {
@@ -268,32 +292,17 @@ impl BinaryConfig {
                 calculated_checksum, header_checksum));
         }
 
-        // Parse variable portions
-        let mut offset = std::mem::size_of::<StoredConfig>();
-        
-        let mut pin_map_entries = Vec::new();
-        for _ in 0..stored_config.pin_map_count {
-            if offset + std::mem::size_of::<StoredPinMapEntry>() > data.len() {
-                return Err("Insufficient data for pin map entries".to_string());
-            }
-            let entry = unsafe {
-                std::ptr::read(data[offset..].as_ptr() as *const StoredPinMapEntry)
-            };
-            pin_map_entries.push(entry);
-            offset += std::mem::size_of::<StoredPinMapEntry>();
-        }
+        // Parse variable portions: each array is viewed as one contiguous slice and
+        // decoded record-by-record straight into an exactly sized Vec
+        let pin_map_entries: Vec<StoredPinMapEntry> = data[STORED_CONFIG_SIZE..pin_map_end]
+            .chunks_exact(PIN_MAP_ENTRY_SIZE)
+            .map(|record| unsafe { std::ptr::read(record.as_ptr() as *const StoredPinMapEntry) })
+            .collect();
 
-        let mut logical_inputs = Vec::new();
-        for _ in 0..stored_config.logical_input_count {
-            if offset + std::mem::size_of::<StoredLogicalInput>() > data.len() {
-                return Err("Insufficient data for logical inputs".to_string());
-            }
-            let input = unsafe {
-                std::ptr::read(data[offset..].as_ptr() as *const StoredLogicalInput)
-            };
-            logical_inputs.push(input);
-            offset += std::mem::size_of::<StoredLogicalInput>();
-        }
+        let logical_inputs: Vec<StoredLogicalInput> = data[pin_map_end..logical_inputs_end]
+            .chunks_exact(LOGICAL_INPUT_SIZE)
+            .map(|record| unsafe { std::ptr::read(record.as_ptr() as *const StoredLogicalInput) })
+            .collect();
 
         Ok(Self {
             stored_config,
@@ -309,13 +318,7 @@ impl BinaryConfig {
         for (i, stored_axis) in self.stored_config.axes.iter().enumerate() {
             // Only include enabled axes
             if stored_axis.enabled != 0 {
-                let curve_name = match stored_axis.curve {
-                    0 => "linear",
-                    1 => "curve1", 
-                    2 => "curve2",
-                    3 => "curve3",
-                    _ => "linear",
-                };
+                let curve_name = AXIS_CURVE_NAMES.get(stored_axis.curve as usize).copied().unwrap_or(AXIS_CURVE_NAMES[0]);
 
                 configs.push(UIAxisConfig {
                     id: i as u8,
@@ -340,21 +343,9 @@ impl BinaryConfig {
         // Extract buttons from logical inputs
         for logical_input in self.logical_inputs.iter() {
             // Map firmware behavior values to function names
-            // From firmware: enum ButtonBehavior { NORMAL=0, MOMENTARY=1, ENC_A=2, ENC_B=3 };
-            let function_name = match logical_input.behavior {
-                0 => "normal",
-                1 => "momentary",
-                2 => "encoder_a",
-                3 => "encoder_b",
-                _ => "normal",
-            };
+            let function_name = BUTTON_BEHAVIOR_NAMES.get(logical_input.behavior as usize).copied().unwrap_or(BUTTON_BEHAVIOR_NAMES[0]);
 
-            let input_type_name = match logical_input.input_type {
-                0 => "Pin",           // INPUT_PIN
-                1 => "Matrix",        // INPUT_MATRIX
-                2 => "Shift Register", // INPUT_SHIFTREG
-                _ => "Unknown",
-            };
+            let input_type_name = INPUT_TYPE_NAMES.get(logical_input.input_type as usize).copied().unwrap_or("Unknown");
 
             // Create descriptive name based on input type
             let name = match logical_input.input_type {
@@ -389,86 +380,93 @@ impl BinaryConfig {
 
     /// Extract pin assignments from the configuration
     pub fn to_pin_assignments(&self) -> std::collections::HashMap<u8, String> {
-        let mut pin_assignments = std::collections::HashMap::new();
+        // Assignments are resolved into a flat table indexed by pin number (no hashing or String
+        // allocation per record); the String map handed to the UI is materialized once at the end
+        let mut by_pin: [Option<&'static str>; 256] = [None; 256];
         
+        // Per-record diagnostics are debug-level: under the default Info filter they are skipped without
+        // formatting, and when enabled they interleave with the warnings they explain
+        //
         // SOURCE 1: Extract analog axis pin assignments
         for (i, stored_axis) in self.stored_config.axes.iter().enumerate() {
             if stored_axis.enabled != 0 {
-                log::info!("Found enabled axis {}: pin {}", i, stored_axis.pin);
-                pin_assignments.insert(stored_axis.pin, "ANALOG_AXIS".to_string());
+                log::debug!("Found enabled axis {}: pin {}", i, stored_axis.pin);
+                by_pin[stored_axis.pin as usize] = Some("ANALOG_AXIS");
             }
         }
         
         // SOURCE 2: Extract pin assignments from pin map entries (PRIMARY source)
-        log::info!("Processing {} pin map entries for pin assignments", self.pin_map_entries.len());
+        log::debug!("Processing {} pin map entries for pin assignments", self.pin_map_entries.len());
         for (i, pin_entry) in self.pin_map_entries.iter().enumerate() {
-            // Extract pin name from first 8 bytes (null-terminated string)
+            // Extract pin name from first 8 bytes (null-terminated string): cut at the first NUL rather
+            // than decoding and re-scanning the zero padding; valid UTF-8 is borrowed in place
             let name_bytes = &pin_entry.name;
-            let pin_name = String::from_utf8_lossy(name_bytes)
-                .trim_end_matches('\0')
-                .trim()
-                .to_string();
+            let name_len = name_bytes.iter().position(|&b| b == 0).unwrap_or(name_bytes.len());
+            let pin_name_raw = String::from_utf8_lossy(&name_bytes[..name_len]);
+            let pin_name = pin_name_raw.trim();
             
-            log::info!("Pin map entry {}: name='{}', type={}", i, pin_name, pin_entry.pin_type);
+            log::debug!("Pin map entry {}: name='{}', type={}", i, pin_name, pin_entry.pin_type);
             
             // Map pin type to function string
             let pin_function = match pin_entry.pin_type {
                 0 => {
-                    log::info!("Skipping PIN_UNUSED");
+                    log::debug!("Skipping PIN_UNUSED");
                     continue;
                 },
-                1 => "BTN",
-                2 => "BTN_ROW",
-                3 => "BTN_COL", 
-                4 => "SHIFTREG_PL",
-                5 => "SHIFTREG_CLK",
-                6 => "SHIFTREG_QH",
-                _ => {
-                    log::warn!("Unknown pin type {}", pin_entry.pin_type);
-                    continue;
-                }
+                pin_type => match PIN_TYPE_NAMES.get(pin_type as usize) {
+                    Some(name) => *name,
+                    None => {
+                        log::warn!("Unknown pin type {}", pin_type);
+                        continue;
+                    }
+                },
             };
             
             // Parse pin name as GPIO number (firmware stores GPIO numbers directly)
             if let Ok(gpio_num) = pin_name.parse::<u8>() {
-                log::info!("Adding pin assignment from pin map: GPIO {} -> {}", gpio_num, pin_function);
-                pin_assignments.insert(gpio_num, pin_function.to_string());
+                log::debug!("Adding pin assignment from pin map: GPIO {} -> {}", gpio_num, pin_function);
+                by_pin[gpio_num as usize] = Some(pin_function);
             } else {
                 log::warn!("Could not parse pin name '{}' as GPIO number", pin_name);
             }
         }
         
         // SOURCE 3: Extract additional pin assignments from logical inputs (SECONDARY source)
-        log::info!("Processing {} logical inputs for additional pin assignments", self.logical_inputs.len());
+        log::debug!("Processing {} logical inputs for additional pin assignments", self.logical_inputs.len());
         for (i, logical_input) in self.logical_inputs.iter().enumerate() {
-            log::info!("Logical input {}: type={}, behavior={}, data={:?}", 
+            log::debug!("Logical input {}: type={}, behavior={}, data={:?}", 
                 i, logical_input.input_type, logical_input.behavior, logical_input.data);
 
             if logical_input.input_type == 0 { // INPUT_PIN type
                 // Firmware format: data[0] = GPIO pin, data[1] = flags / reserved (NOT part of pin number)
                 let gpio_pin = logical_input.data[0];
                 let flags = logical_input.data[1];
-                log::info!("INPUT_PIN found: gpio_pin={} flags=0x{:02X}", gpio_pin, flags);
+                log::debug!("INPUT_PIN found: gpio_pin={} flags=0x{:02X}", gpio_pin, flags);
 
                 if gpio_pin <= 29 { // RP2040 valid GPIO range 0-29
-                    if !pin_assignments.contains_key(&gpio_pin) {
-                        log::info!("Adding pin assignment from logical input: GPIO {} -> BTN", gpio_pin);
-                        pin_assignments.insert(gpio_pin, "BTN".to_string());
+                    if by_pin[gpio_pin as usize].is_none() {
+                        log::debug!("Adding pin assignment from logical input: GPIO {} -> BTN", gpio_pin);
+                        by_pin[gpio_pin as usize] = Some("BTN");
                     } else {
-                        log::info!("GPIO {} already assigned from pin map, skipping logical input", gpio_pin);
+                        log::debug!("GPIO {} already assigned from pin map, skipping logical input", gpio_pin);
                     }
                 } else {
                     log::warn!("GPIO {} out of valid range (0-29) in logical input; ignoring", gpio_pin);
                 }
             } else if logical_input.input_type == 1 { // INPUT_MATRIX
-                log::info!("Skipping INPUT_MATRIX (type 1) - doesn't map to single GPIO pins");
+                log::debug!("Skipping INPUT_MATRIX (type 1) - doesn't map to single GPIO pins");
             } else if logical_input.input_type == 2 { // INPUT_SHIFTREG
-                log::info!("Skipping INPUT_SHIFTREG (type 2) - shift register bits map via shift register chain, physical control pins provided in pin map");
+                log::debug!("Skipping INPUT_SHIFTREG (type 2) - shift register bits map via shift register chain, physical control pins provided in pin map");
             } else {
-                log::info!("Unknown logical input type: {}", logical_input.input_type);
+                log::debug!("Unknown logical input type: {}", logical_input.input_type);
             }
         }
         
+        let pin_assignments: std::collections::HashMap<u8, String> = by_pin.iter()
+            .enumerate()
+            .filter_map(|(pin, function)| function.map(|f| (pin as u8, f.to_string())))
+            .collect();
+        
         log::info!("Final pin assignments ({} total): {:?}", pin_assignments.len(), pin_assignments);
         pin_assignments
     }
@@ -613,6 +611,38 @@ mod tests {
         assert_eq!(config.stored_config.logical_input_count, parsed.stored_config.logical_input_count);
         assert_eq!(config.pin_map_entries.len(), parsed.pin_map_entries.len());
         assert_eq!(config.logical_inputs.len(), parsed.logical_inputs.len());
+        assert_eq!(parsed.pin_map_entries[1].name, config.pin_map_entries[1].name);
+        assert_eq!(parsed.logical_inputs[2].joy_button_id, 2);
+    }
+
+    #[test]
+    fn test_from_bytes_rejects_truncated_variable_sections() {
+        let mut config = BinaryConfig::new();
+        config.stored_config.pin_map_count = 2;
+        config.pin_map_entries.push(StoredPinMapEntry { name: [0; 8], pin_type: 1, reserved: 0 });
+        config.pin_map_entries.push(StoredPinMapEntry { name: [0; 8], pin_type: 1, reserved: 0 });
+        let bytes = config.to_bytes().expect("Serialization failed");
+
+        let err = BinaryConfig::from_bytes(&bytes[..bytes.len() - 1]).unwrap_err();
+        assert!(err.starts_with("Insufficient data"), "unexpected error: {}", err);
     }
 
-}
\ No newline at end of file
+    #[test]
+    fn test_pin_assignments_from_all_sources() {
+        let mut config = BinaryConfig::new();
+        config.stored_config.axes[0].enabled = 1;
+        config.stored_config.axes[0].pin = 26;
+        config.pin_map_entries.push(StoredPinMapEntry { name: [b'5', 0, 0, 0, 0, 0, 0, 0], pin_type: 1, reserved: 0 });
+        config.pin_map_entries.push(StoredPinMapEntry { name: [b'1', b'2', 0, 0, 0, 0, 0, 0], pin_type: 0, reserved: 0 });
+        config.logical_inputs.push(StoredLogicalInput {
+            input_type: 0, behavior: 0, joy_button_id: 0, reverse: 0, encoder_latch_mode: 0, reserved: [0; 3], data: [7, 0],
+        });
+
+        let pins = config.to_pin_assignments();
+        assert_eq!(pins.len(), 3);
+        assert_eq!(pins.get(&26).map(String::as_str), Some("ANALOG_AXIS"));
+        assert_eq!(pins.get(&5).map(String::as_str), Some("BTN"));
+        assert_eq!(pins.get(&7).map(String::as_str), Some("BTN"));
+    }
+
+}
@@ -337,12 +337,10 @@ impl DeviceManager {
         // Update device state to connecting
         self.update_device_connection_state(device_id, ConnectionState::Connecting).await;
 
-        // Get the device info from discovery for proper connection
-        let serial_devices = SerialInterface::discover_devices()
+        // Get the device info for proper connection; only the target port is probed,
+        // since identifying every other port costs an open + IDENTIFY round trip each
+        let device_info = SerialInterface::discover_device(&device.port_name)
             .map_err(DeviceError::SerialError)?;
-        let device_info = serial_devices.iter()
-            .find(|info| info.port_name == device.port_name)
-            .cloned();
         
         // Attempt connection
         let mut serial_interface = SerialInterface::new();
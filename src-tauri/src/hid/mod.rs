@@ -381,9 +381,8 @@ impl HidReader {
         let mapping_opt = { self.mapping_data.lock().unwrap().clone() };
         let selected_off_opt = { *self.selected_offset.lock().unwrap() };
         let last_raw_val = { *self.last_raw_value.lock().unwrap() };
-        let mut raw_bits: Vec<u8> = Vec::new();
         // Interpret report[0..16] as raw button bytes regardless of report ID presence
-        for byte_index in 0..16 { raw_bits.push(report[byte_index]); }
+        let raw_bits: &[u8] = &report[..16];
         // Derive bit->logical (0..15) pressed arrays from current cached state
         let logical_state = self.last_state.lock().unwrap().buttons;
         let mut logical_pressed: Vec<u8> = Vec::new();
@@ -398,8 +397,13 @@ impl HidReader {
         // Additional legacy diagnostic when mapping is absent
         let legacy_extra = if mapping_opt.is_none() {
             // Provide the 8-byte window starting at selected offset (if any)
-            let mut window: Vec<String> = Vec::new();
-            if let Some(off) = selected_off_opt { for i in 0..8 { if off + i < report.len() { window.push(format!("0x{:02X}", report[off + i])); } } }
+            // Slice the window once (naturally short near the end of the report) instead of bounds-checking each index
+            let window: Vec<String> = selected_off_opt
+                .and_then(|off| report.get(off..(off + 8).min(report.len())))
+                .unwrap_or(&[])
+                .iter()
+                .map(|b| format!("0x{:02X}", b))
+                .collect();
             Some(serde_json::json!({
                 "selected_offset": selected_off_opt,
                 "window_8_bytes_from_offset": window,
@@ -611,12 +615,10 @@ impl HidReader {
 
                 // FALLBACK: heuristic logic (legacy firmware)
                 let data = &buf[..(sz as usize).min(buf.len())];
-                let mut buttons0: u64 = 0;
-                let mut buttons1: u64 = 0;
-                for (i, b) in data.iter().take(8).enumerate() { buttons0 |= (*b as u64) << (i * 8); }
-                if data.len() > 1 { for (i, b) in data[1..].iter().take(8).enumerate() { buttons1 |= (*b as u64) << (i * 8); } }
+                let buttons0 = le_u64_prefix(data);
+                let buttons1 = if data.len() > 1 { le_u64_prefix(&data[1..]) } else { 0 };
                 let mut extra_candidates: Vec<(usize, u64)> = Vec::new();
-                for &start in &[16usize, 17, 24, 32] { if data.len() > start { let mut val: u64 = 0; for (i, b) in data[start..].iter().take(8).enumerate() { val |= (*b as u64) << (i * 8); } extra_candidates.push((start, val)); } }
+                for &start in &[16usize, 17, 24, 32] { if data.len() > start { extra_candidates.push((start, le_u64_prefix(&data[start..]))); } }
                 if let Some(&b0) = data.get(0) { match first_byte_constant { None => first_byte_constant = Some(b0), Some(prev) if prev != b0 => { first_byte_varies = true; }, _ => {} } }
                 if baseline_0.is_none() { baseline_0 = Some(buttons0); }
                 if baseline_1.is_none() { baseline_1 = Some(buttons1); }
@@ -712,6 +714,14 @@ impl HidReader {
     }
 }
 
+/// Interpret up to the first 8 bytes as a little-endian u64 (missing high bytes read as zero).
+fn le_u64_prefix(bytes: &[u8]) -> u64 {
+    let mut word = [0u8; 8];
+    let n = bytes.len().min(8);
+    word[..n].copy_from_slice(&bytes[..n]);
+    u64::from_le_bytes(word)
+}
+
 // --- Tests -----------------------------------------------------------------
 #[cfg(test)]
 mod tests {
@@ -748,6 +758,14 @@ mod tests {
         buf
     }
 
+    #[test]
+    fn le_u64_prefix_matches_bytewise_shift() {
+        let report = [0x01u8, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0xFF];
+        assert_eq!(le_u64_prefix(&report), 0x0807060504030201);
+        assert_eq!(le_u64_prefix(&report[6..]), 0xFF0807);
+        assert_eq!(le_u64_prefix(&[]), 0);
+    }
+
     #[test]
     fn parse_sequential_mapping_info() {
         // button_count = 12, mapping_crc=0 -> sequential
@@ -0,0 +1,42 @@
+use super::{Result, SerialError};
+
+/// Decode a READ_FILE response line into the file's raw bytes
+/// Format: FILE_DATA:[filename]:[size]:[hex_data]
+/// A bare hex line (no FILE_DATA prefix) is accepted without size validation
+pub fn decode_file_data_response(response: &str) -> Result<Vec<u8>> {
+    let (expected_size, hex_data) = if let Some(after_prefix) = response.strip_prefix("FILE_DATA:") {
+        // Split off filename and size in place; the hex payload stays a borrowed tail with no intermediate Vec
+        let (_filename, size_str, hex_data) = match after_prefix.split_once(':')
+            .and_then(|(name, rest)| rest.split_once(':').map(|(size, hex)| (name, size, hex)))
+        {
+            Some(parts) => parts,
+            None => return Err(SerialError::ProtocolError(format!("Invalid FILE_DATA response format: {}", response))),
+        };
+        let expected_size = size_str.parse::<usize>()
+            .map_err(|_| SerialError::ProtocolError("Invalid file size in response".to_string()))?;
+        (Some(expected_size), hex_data.trim())
+    } else {
+        (None, response.trim())
+    };
+
+    log::debug!("Processing hex data: '{}'", hex_data);
+
+    // Decode in a single pass; rejects non-hex characters and odd lengths
+    let bytes = hex::decode(hex_data)
+        .map_err(|e| SerialError::ProtocolError(format!("Invalid hex data in response: {}", e)))?;
+
+    log::info!("Decoded {} bytes from hex response", bytes.len());
+
+    // Validate size if we have expected size from FILE_DATA response
+    if let Some(expected) = expected_size {
+        if bytes.len() != expected {
+            return Err(SerialError::ProtocolError(format!(
+                "Size mismatch: decoded {} bytes, expected {} bytes",
+                bytes.len(), expected
+            )));
+        }
+        log::info!("Size validation passed: {} bytes", bytes.len());
+    }
+
+    Ok(bytes)
+}
@@ -2,6 +2,10 @@
 use std::time::Duration;
 use serialport::SerialPort;
 use tokio::time::timeout;
+#[cfg(unix)]
+use std::os::unix::io::{AsRawFd, RawFd};
+#[cfg(unix)]
+use tokio::io::{unix::AsyncFd, Interest};
 // Removed legacy channel imports
 
 use super::{Result, SerialError, SerialDeviceInfo};
@@ -26,6 +30,45 @@ pub struct SerialInterface {
     port: Option<Box<dyn SerialPort>>,
     device_info: Option<SerialDeviceInfo>,
     // Legacy unified handle storage removed (handle managed externally)
+    #[cfg(unix)]
+    port_fd: Option<RawFd>,
+    // Reactor registration for port_fd; created on the first read since it needs a running tokio runtime
+    #[cfg(unix)]
+    read_ready: Option<AsyncFd<RawFd>>,
+}
+
+/// Temporarily overrides a port's timeout and restores the previous value when dropped
+#[cfg(unix)]
+struct PortTimeoutGuard<'a> {
+    port: &'a mut Box<dyn SerialPort>,
+    previous: Duration,
+}
+
+#[cfg(unix)]
+impl<'a> PortTimeoutGuard<'a> {
+    fn set(port: &'a mut Box<dyn SerialPort>, timeout: Duration) -> Result<Self> {
+        let previous = port.timeout();
+        port.set_timeout(timeout)?;
+        Ok(Self { port, previous })
+    }
+}
+
+#[cfg(unix)]
+impl std::ops::Deref for PortTimeoutGuard<'_> {
+    type Target = Box<dyn SerialPort>;
+    fn deref(&self) -> &Self::Target { self.port }
+}
+
+#[cfg(unix)]
+impl std::ops::DerefMut for PortTimeoutGuard<'_> {
+    fn deref_mut(&mut self) -> &mut Self::Target { self.port }
+}
+
+#[cfg(unix)]
+impl Drop for PortTimeoutGuard<'_> {
+    fn drop(&mut self) {
+        let _ = self.port.set_timeout(self.previous);
+    }
 }
 
 impl SerialInterface {
@@ -34,6 +77,10 @@ impl SerialInterface {
             port: None,
             device_info: None,
             // unified handle now managed by DeviceManager
+            #[cfg(unix)]
+            port_fd: None,
+            #[cfg(unix)]
+            read_ready: None,
         }
     }
 
@@ -47,17 +94,7 @@ impl SerialInterface {
             match Self::identify_device(&port_info.port_name) {
                 Ok(Some(mut device_info)) => {
                     // Enhance device info with USB details if available
-                    if let serialport::SerialPortType::UsbPort(usb_info) = &port_info.port_type {
-                        device_info.serial_number = usb_info.serial_number.clone();
-                        if device_info.manufacturer.is_none() {
-                            device_info.manufacturer = usb_info.manufacturer.clone();
-                        }
-                        if device_info.product.is_none() {
-                            device_info.product = usb_info.product.clone();
-                        }
-                        device_info.vid = usb_info.vid;
-                        device_info.pid = usb_info.pid;
-                    }
+                    Self::apply_usb_details(&mut device_info, &port_info.port_type);
                     
                     // log::info!("Found JoyCore device on port: {} (S/N: {:?})", 
                     //           port_info.port_name, device_info.serial_number);
@@ -77,13 +114,69 @@ impl SerialInterface {
         Ok(devices)
     }
 
+    /// Identify a single, already known port without probing every other port on the system
+    pub fn discover_device(port_name: &str) -> Result<Option<SerialDeviceInfo>> {
+        let port_type = serialport::available_ports()?
+            .into_iter()
+            .find(|port_info| port_info.port_name == port_name)
+            .map(|port_info| port_info.port_type);
+
+        match Self::identify_device(port_name) {
+            Ok(Some(mut device_info)) => {
+                if let Some(port_type) = &port_type {
+                    Self::apply_usb_details(&mut device_info, port_type);
+                }
+                Ok(Some(device_info))
+            }
+            Ok(None) => Ok(None),
+            Err(e) => {
+                log::debug!("Failed to identify port {}: {}", port_name, e);
+                Ok(None)
+            }
+        }
+    }
+
+    /// Copy USB descriptor details reported by the OS into identified device info
+    fn apply_usb_details(device_info: &mut SerialDeviceInfo, port_type: &serialport::SerialPortType) {
+        if let serialport::SerialPortType::UsbPort(usb_info) = port_type {
+            device_info.serial_number = usb_info.serial_number.clone();
+            if device_info.manufacturer.is_none() {
+                device_info.manufacturer = usb_info.manufacturer.clone();
+            }
+            if device_info.product.is_none() {
+                device_info.product = usb_info.product.clone();
+            }
+            device_info.vid = usb_info.vid;
+            device_info.pid = usb_info.pid;
+        }
+    }
+
+    /// Open a port for a persistent connection
+    fn open_port(&mut self, port_name: &str) -> Result<Box<dyn SerialPort>> {
+        let builder = serialport::new(port_name, BAUD_RATE)
+            .timeout(Duration::from_millis(500));
+
+        // Keep the native fd so reads can wait for readiness in the tokio reactor
+        #[cfg(unix)]
+        let port: Box<dyn SerialPort> = {
+            let native = builder.open_native()
+                .map_err(|e| SerialError::ConnectionFailed(e.to_string()))?;
+            self.read_ready = None;
+            self.port_fd = Some(native.as_raw_fd());
+            Box::new(native)
+        };
+
+        #[cfg(not(unix))]
+        let port = builder.open()
+            .map_err(|e| SerialError::ConnectionFailed(e.to_string()))?;
+
+        Ok(port)
+    }
+
     /// Connect to a specific device
     pub fn connect(&mut self, port_name: &str) -> Result<()> {
         // Open the port for persistent connection
-        let port = serialport::new(port_name, BAUD_RATE)
-            .timeout(Duration::from_millis(500))
-            .open()
-            .map_err(|e| SerialError::ConnectionFailed(e.to_string()))?;
+        let port = self.open_port(port_name)?;
 
         // Re-identify device to get fresh firmware version
         let device_info = match Self::identify_device(port_name)? {
@@ -114,10 +207,7 @@ impl SerialInterface {
 
     /// Connect to a specific device with known device info
     pub fn connect_with_info(&mut self, device_info: SerialDeviceInfo) -> Result<()> {
-        let port = serialport::new(&device_info.port_name, BAUD_RATE)
-            .timeout(Duration::from_millis(500))
-            .open()
-            .map_err(|e| SerialError::ConnectionFailed(e.to_string()))?;
+        let port = self.open_port(&device_info.port_name)?;
 
         self.port = Some(port);
         self.device_info = Some(device_info.clone());
@@ -135,6 +225,12 @@ impl SerialInterface {
         
     // Unified reader owned externally; no channel cleanup needed
         
+        // Deregister the fd from the reactor before the port closes it
+        #[cfg(unix)]
+        {
+            self.read_ready = None;
+            self.port_fd = None;
+        }
         self.port = None;
         self.device_info = None;
     }
@@ -164,130 +260,81 @@ impl SerialInterface {
 
     /// Read data from the connected device with timeout
     pub async fn read_data(&mut self, buffer: &mut [u8], timeout_ms: u64) -> Result<usize> {
+        timeout(Duration::from_millis(timeout_ms), self.read_available(buffer))
+            .await
+            .map_err(|_| SerialError::Timeout)?
+    }
+
+    /// Wait in the tokio reactor until the port's fd is readable, then read what the driver has queued.
+    /// An idle line costs no syscalls or timer wakeups.
+    #[cfg(unix)]
+    async fn read_available(&mut self, buffer: &mut [u8]) -> Result<usize> {
+        if self.read_ready.is_none() {
+            let fd = self.port_fd
+                .ok_or(SerialError::ConnectionFailed("Not connected".to_string()))?;
+            self.read_ready = Some(AsyncFd::with_interest(fd, Interest::READABLE)?);
+        }
+        let read_ready = self.read_ready.as_ref().expect("registered above");
         let port = self.port.as_mut()
             .ok_or(SerialError::ConnectionFailed("Not connected".to_string()))?;
 
-        let read_operation = async {
-            let mut total_read = 0;
-            let mut attempts = 0;
-            const MAX_ATTEMPTS: usize = 100;
-
-            while total_read == 0 && attempts < MAX_ATTEMPTS {
-                match port.bytes_to_read() {
-                    Ok(0) => {
-                        tokio::time::sleep(Duration::from_millis(10)).await;
-                        attempts += 1;
-                    }
-                    Ok(_) => {
-                        match port.read(&mut buffer[total_read..]) {
-                            Ok(bytes_read) => {
-                                total_read += bytes_read;
-                                break;
-                            }
-                            Err(ref e) if e.kind() == std::io::ErrorKind::TimedOut => {
-                                attempts += 1;
-                            }
-                            Err(e) => return Err(SerialError::IoError(e)),
-                        }
-                    }
-                    Err(e) => return Err(SerialError::SerialportError(e)),
-                }
-            }
-
-            if total_read == 0 {
-                Err(SerialError::Timeout)
-            } else {
-                Ok(total_read)
+        // With a zero port timeout the driver's poll-then-read never blocks the worker: stale readiness
+        // surfaces as TimedOut, which is reported as WouldBlock so tokio clears it and waits for the next edge.
+        // Restored on drop, so the connection's write timeout survives the reader task cancelling this future.
+        let mut port = PortTimeoutGuard::set(port, Duration::ZERO)?;
+
+        loop {
+            let mut ready = read_ready.readable().await?;
+            let read_result = ready.try_io(|_| match port.read(buffer) {
+                Err(e) if e.kind() == std::io::ErrorKind::TimedOut => Err(std::io::ErrorKind::WouldBlock.into()),
+                other => other,
+            });
+            match read_result {
+                Ok(Ok(0)) => return Err(SerialError::IoError(std::io::Error::new(
+                    std::io::ErrorKind::UnexpectedEof, "Serial port closed"))),
+                Ok(Ok(bytes_read)) => return Ok(bytes_read),
+                Ok(Err(e)) => return Err(SerialError::IoError(e)),
+                Err(_would_block) => continue,
             }
-        };
-
-        timeout(Duration::from_millis(timeout_ms), read_operation)
-            .await
-            .map_err(|_| SerialError::Timeout)?
+        }
     }
 
-    /// Send a command and wait for response with message routing
-    pub async fn send_command(&mut self, command: &str) -> Result<String> {
-        log::debug!("Sending command: {}", command);
-        let command_with_newline = format!("{}\n", command);
-        self.send_data(command_with_newline.as_bytes()).await?;
+    /// Probe the driver's input queue and read once bytes are waiting
+    #[cfg(not(unix))]
+    async fn read_available(&mut self, buffer: &mut [u8]) -> Result<usize> {
+        let port = self.port.as_mut()
+            .ok_or(SerialError::ConnectionFailed("Not connected".to_string()))?;
 
-    // Use larger buffer and line-by-line reading
-        let mut response_lines = Vec::new();
-        let mut accumulated_data = Vec::new();
-        let start_time = std::time::Instant::now();
-        let timeout_duration = std::time::Duration::from_secs_f32(0.5);
-        
-        // Give device a moment to start responding - reduced delay
-        tokio::time::sleep(std::time::Duration::from_millis(20)).await;
-        
-        while start_time.elapsed() < timeout_duration {
-            let mut buffer = [0u8; 4096]; // Increased buffer size
-            
-            match timeout(std::time::Duration::from_millis(100), self.read_data(&mut buffer, 100)).await {
-                Ok(Ok(bytes_read)) => {
-                    if bytes_read > 0 {
-                        accumulated_data.extend_from_slice(&buffer[..bytes_read]);
-                        
-                        // Process complete lines with routing
-                        while let Some(line_end) = accumulated_data.iter().position(|&b| b == b'\n' || b == b'\r') {
-                            let line_bytes = accumulated_data.drain(..=line_end).collect::<Vec<u8>>();
-                            let line = String::from_utf8_lossy(&line_bytes).trim().to_string();
-                            
-                            if !line.is_empty() {
-                                log::debug!("Received line: {}", line);
-                                
-                                // (legacy routing removed)
-                                // Always add to response for command processing
-                                response_lines.push(line.clone());
-                                
-                                // Check for termination conditions like Python script
-                                if line == "END_FILES" || line.starts_with("ERROR:") || line.starts_with("FILE_DATA:") {
-                                    log::debug!("Found termination condition: {}", line);
-                                    // For FILE_DATA, this should be the complete response
-                                    break;
-                                }
-                            }
+        let mut total_read = 0;
+        let mut attempts = 0;
+        const MAX_ATTEMPTS: usize = 100;
+
+        while total_read == 0 && attempts < MAX_ATTEMPTS {
+            match port.bytes_to_read() {
+                Ok(0) => {
+                    tokio::time::sleep(Duration::from_millis(10)).await;
+                    attempts += 1;
+                }
+                Ok(_) => {
+                    match port.read(&mut buffer[total_read..]) {
+                        Ok(bytes_read) => {
+                            total_read += bytes_read;
+                            break;
                         }
-                    } else {
-                        // No more data, wait a bit
-                        tokio::time::sleep(std::time::Duration::from_millis(5)).await;
+                        Err(ref e) if e.kind() == std::io::ErrorKind::TimedOut => {
+                            attempts += 1;
+                        }
+                        Err(e) => return Err(SerialError::IoError(e)),
                     }
                 }
-                Ok(Err(_)) => {
-                    // Serial read error, wait a bit
-                    tokio::time::sleep(std::time::Duration::from_millis(5)).await;
-                }
-                Err(_) => {
-                    // Timeout on this read, continue
-                    tokio::time::sleep(std::time::Duration::from_millis(5)).await;
-                }
-            }
-        }
-        
-        // Process any remaining data as a final line
-        if !accumulated_data.is_empty() {
-            let line = String::from_utf8_lossy(&accumulated_data).trim().to_string();
-            if !line.is_empty() {
-                // (legacy routing removed)
-                response_lines.push(line);
+                Err(e) => return Err(SerialError::SerialportError(e)),
             }
         }
-        
-        let full_response = response_lines.join("\n");
-        log::debug!("Complete response ({} lines): {}", response_lines.len(), full_response);
-        Ok(full_response)
-    }
 
-    /// Read a line from the device with timeout (for streaming)
-    pub async fn read_line_timeout(&mut self, timeout_ms: u64) -> Result<String> {
-        let mut buffer = [0u8; 1024];
-        let bytes_read = self.read_data(&mut buffer, timeout_ms).await?;
-        
-        if bytes_read > 0 {
-            Ok(String::from_utf8_lossy(&buffer[..bytes_read]).to_string())
+        if total_read == 0 {
+            Err(SerialError::Timeout)
         } else {
-            Ok(String::new())
+            Ok(total_read)
         }
     }
 
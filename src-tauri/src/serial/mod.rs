@@ -1,3 +1,4 @@
+pub mod file_data;
 pub mod interface;
 pub mod protocol;
 pub mod unified;
@@ -1,5 +1,6 @@
 use serde::{Deserialize, Serialize};
 use super::{Result, SerialError, SerialInterface};
+use super::file_data::decode_file_data_response;
 use crate::serial::unified::{UnifiedSerialHandle};
 use crate::serial::unified::types::{CommandSpec, ResponseMatcher};
 use std::time::Duration;
@@ -218,13 +219,20 @@ impl ConfigProtocol {
 
     /// List files available on the device
     pub async fn list_files(&mut self) -> Result<Vec<String>> {
-    let spec = CommandSpec { name: "LIST_FILES", timeout: Duration::from_millis(1000), matcher: ResponseMatcher::Contains("END_FILES"), test_min_duration_ms: None }; let response = { let resp = self.handle.send_command("LIST_FILES".to_string(), spec).await?; resp.lines.join("\n") };
+    let spec = CommandSpec { name: "LIST_FILES", timeout: Duration::from_millis(1000), matcher: ResponseMatcher::Contains("END_FILES"), test_min_duration_ms: None }; let resp = self.handle.send_command("LIST_FILES".to_string(), spec).await?;
         
-        // Parse the response - filter out protocol markers
-        let files: Vec<String> = response
-            .lines()
-            .map(|line| line.trim().to_string())
-            .filter(|line| !line.is_empty() && line != "FILES:" && line != "END_FILES")
+        // Consume the response lines directly - filter out protocol markers, stop at the end marker
+        let files: Vec<String> = resp.lines
+            .into_iter()
+            .take_while(|line| line.trim() != "END_FILES")
+            .filter_map(|line| {
+                let name = line.trim();
+                if name.is_empty() || name == "FILES:" {
+                    None
+                } else {
+                    Some(name.to_string())
+                }
+            })
             .collect();
         
         Ok(files)
@@ -234,64 +242,21 @@ impl ConfigProtocol {
     pub async fn read_file(&mut self, filename: &str) -> Result<Vec<u8>> {
         log::info!("Reading file: {}", filename);
         let command = format!("READ_FILE {}", filename);
-    let spec = CommandSpec { name: "READ_FILE", timeout: Duration::from_millis(3000), matcher: ResponseMatcher::Contains("FILE_DATA:"), test_min_duration_ms: None }; let response = { let resp = self.handle.send_command(command.clone(), spec).await?; resp.lines.join("\n") };
+    let spec = CommandSpec { name: "READ_FILE", timeout: Duration::from_millis(3000), matcher: ResponseMatcher::Contains("FILE_DATA:"), test_min_duration_ms: None }; let resp = self.handle.send_command(command.clone(), spec).await?;
         
-        log::info!("Raw response length: {} chars", response.len());
-        log::info!("Raw response: '{}'", response);
+        // Borrow the payload line in place rather than joining every response line (and the hex payload) into a new String
+        let response: &str = resp.lines.iter().rev()
+            .find(|line| line.starts_with("FILE_DATA:"))
+            .or_else(|| resp.lines.last())
+            .map(|line| line.as_str())
+            .unwrap_or("");
         
-        // Parse firmware response format: FILE_DATA:/config.bin:606:[hex_data]
-        let (expected_size, hex_data) = if response.starts_with("FILE_DATA:") {
-            // Find the third colon which separates size from hex data
-            let after_prefix = response.strip_prefix("FILE_DATA:").unwrap_or(&response);
-            let parts: Vec<&str> = after_prefix.splitn(3, ':').collect();
-            if parts.len() >= 3 {
-                let expected_size = parts[1].parse::<usize>()
-                    .map_err(|_| SerialError::ProtocolError("Invalid file size in response".to_string()))?;
-                (Some(expected_size), parts[2].trim()) // The hex data part
-            } else {
-                return Err(SerialError::ProtocolError(format!("Invalid FILE_DATA response format: {}", response)));
-            }
-        } else {
-            (None, response.trim())
-        };
-
-        log::info!("Processing hex data: '{}'", hex_data);
-        
-        // Validate hex data - should only contain hex characters
-        if !hex_data.chars().all(|c| c.is_ascii_hexdigit()) {
-            return Err(SerialError::ProtocolError(format!("Response contains non-hex characters: '{}'", hex_data)));
-        }
-        
-        // Must be even length for valid hex encoding
-        if hex_data.len() % 2 != 0 {
-            return Err(SerialError::ProtocolError(format!("Hex data has odd length: {}", hex_data.len())));
-        }
+        // Payload dumps are debug-only: the log macros skip formatting entirely when Debug is filtered out
+        log::debug!("Raw response length: {} chars", response.len());
+        log::debug!("Raw response: '{}'", response);
         
-        let mut bytes = Vec::new();
-        
-        // Parse hex string to bytes
-        for chunk in hex_data.as_bytes().chunks(2) {
-            let hex_str = std::str::from_utf8(chunk)
-                .map_err(|_| SerialError::ProtocolError("Invalid hex response".to_string()))?;
-            let byte = u8::from_str_radix(hex_str, 16)
-                .map_err(|e| SerialError::ProtocolError(format!("Invalid hex byte '{}': {}", hex_str, e)))?;
-            bytes.push(byte);
-        }
-        
-        log::info!("Decoded {} bytes from hex response", bytes.len());
-        
-        // Validate size if we have expected size from FILE_DATA response
-        if let Some(expected) = expected_size {
-            if bytes.len() != expected {
-                return Err(SerialError::ProtocolError(format!(
-                    "Size mismatch: decoded {} bytes, expected {} bytes", 
-                    bytes.len(), expected
-                )));
-            }
-            log::info!("Size validation passed: {} bytes", bytes.len());
-        }
-        
-        Ok(bytes)
+        // Parse firmware response format: FILE_DATA:/config.bin:606:[hex_data]
+        decode_file_data_response(response)
     }
 
     /// Save current configuration to device storage
@@ -6,6 +6,9 @@ use tokio::sync::Mutex;
 use super::types::*;
 use std::time::Duration;
 
+/// Bytes requested per port read; one read drains everything the driver has queued instead of trickling in small slices.
+const READ_CHUNK_SIZE: usize = 4096;
+
 #[derive(Clone)]
 pub struct UnifiedSerialHandle {
     pub cmd_tx: mpsc::Sender<SerialCommand>,
@@ -54,15 +57,19 @@ pub(crate) async fn reader_task(
     metrics_tx: watch::Sender<MetricsSnapshot>,
 ) {
     use tokio::select;
-    use tokio::time::sleep;
+    use tokio::time::sleep_until;
 
-    let mut partial = String::new();
+    let mut partial: Vec<u8> = Vec::with_capacity(READ_CHUNK_SIZE * 2);
     let mut pending: Option<PendingCommand> = None;
     let mut snapshot = Arc::new(RawStateSnapshot::default());
     let monitor_prefixes = ["GPIO_STATES:", "MATRIX_STATE:", "SHIFT_REG:"];
     let mut metrics = MetricsSnapshot::default();
+    // Reused for every read; the read future only reports how many bytes it filled
+    let mut read_buf = vec![0u8; READ_CHUNK_SIZE];
 
     loop {
+        // Wake only when the in-flight command can complete or time out without new input; an idle reader waits on I/O alone
+        let deadline = pending.as_ref().map(pending_deadline);
         select! {
             maybe_cmd = cmd_rx.recv() => {
                 match maybe_cmd {
@@ -77,38 +84,37 @@ pub(crate) async fn reader_task(
                 }
             },
             read_res = async {
-                let mut buf = [0u8; 512];
-                let res = { let mut guard = interface.lock().await; guard.read_data(&mut buf, 25).await.map(|n| (buf, n)) };
-                res
+                let mut guard = interface.lock().await; guard.read_data(&mut read_buf, 25).await
             } => {
                 match read_res {
-                    Ok((buf, n)) if n > 0 => {
-                        let chunk_result = std::str::from_utf8(&buf[..n]);
-                        let chunk = match chunk_result { Ok(s) => s.to_string(), Err(_) => { metrics.utf8_decode_errors +=1; String::from_utf8_lossy(&buf[..n]).to_string() } }; 
-                        partial.push_str(&chunk);
-                        let mut idx = 0;
-                        while let Some(pos) = partial[idx..].find(['\n','\r']) {
-                            let abs = idx + pos; let line = partial[..abs].to_string();
-                            if !line.trim().is_empty() { metrics.lines_read +=1; let before = metrics.monitor_events; let before_unclassified = metrics.unclassified_lines; process_line(&line, &events_tx, &mut snapshot, &snapshot_tx, pending.as_mut(), &monitor_prefixes, &mut metrics); if metrics.monitor_events != before || metrics.unclassified_lines != before_unclassified { let _ = metrics_tx.send(metrics.clone()); }
-                if let Some(p) = pending.as_mut() { if !monitor_prefixes.iter().any(|pre| line.starts_with(pre)) { p.buffer.push(line.clone()); if p.spec.matcher.is_complete(&p.buffer) {
+                    Ok(n) if n > 0 => {
+                        // Append raw bytes and split on line terminators in place; each completed line is decoded once
+                        // (also keeps multi-byte UTF-8 sequences intact when they straddle two reads).
+                        partial.extend_from_slice(&read_buf[..n]);
+                        let mut consumed = 0;
+                        while let Some(pos) = partial[consumed..].iter().position(|&b| b == b'\n' || b == b'\r') {
+                            let line_bytes = &partial[consumed..consumed + pos]; consumed += pos + 1;
+                            if line_bytes.iter().all(|b| b.is_ascii_whitespace()) { continue; }
+                            let line = match std::str::from_utf8(line_bytes) { Ok(s) => s.to_string(), Err(_) => { metrics.utf8_decode_errors +=1; String::from_utf8_lossy(line_bytes).into_owned() } };
+                            metrics.lines_read +=1; let before = metrics.monitor_events; let before_unclassified = metrics.unclassified_lines; process_line(&line, &events_tx, &mut snapshot, &snapshot_tx, pending.as_mut(), &monitor_prefixes, &mut metrics); if metrics.monitor_events != before || metrics.unclassified_lines != before_unclassified { let _ = metrics_tx.send(metrics.clone()); }
+                if let Some(p) = pending.as_mut() { if !monitor_prefixes.iter().any(|pre| line.starts_with(pre)) { p.buffer.push(line); if p.spec.matcher.is_complete(&p.buffer) {
                     // Enforce optional minimum duration before allowing completion (used by tests for latency metrics)
                     if let Some(min_ms) = p.spec.test_min_duration_ms { if p.started.elapsed().as_millis() < min_ms as u128 { continue; } }
-                    let p_done = pending.take().unwrap(); let latency_ms = p_done.started.elapsed().as_millis() as u64; metrics.command_completed +=1; metrics.command_last_latency_ms = Some(latency_ms); metrics.command_min_latency_ms = Some(match metrics.command_min_latency_ms { Some(m) => m.min(latency_ms), None => latency_ms }); metrics.command_max_latency_ms = Some(match metrics.command_max_latency_ms { Some(m) => m.max(latency_ms), None => latency_ms }); metrics.command_latency_samples +=1; // update avg
-                    metrics.command_avg_latency_ms = Some(match (metrics.command_avg_latency_ms, metrics.command_latency_samples) { (Some(avg), samples) if samples>1 => ((avg * (samples as f64 -1.0)) + latency_ms as f64) / samples as f64, _ => latency_ms as f64 });
-                    metrics.command_ema_latency_ms = Some(match metrics.command_ema_latency_ms { Some(prev) => (prev * 0.8) + (latency_ms as f64 * 0.2), None => latency_ms as f64 });
-                    let _ = metrics_tx.send(metrics.clone()); let resp = CommandResponse { lines: p_done.buffer, finished_reason: FinishReason::MatcherSatisfied }; let _ = p_done.responder.send(Ok(resp)); } } }
-                            }
-                            let mut advance = abs + 1; while advance < partial.len() && (partial.as_bytes()[advance]==b'\n' || partial.as_bytes()[advance]==b'\r') { advance+=1; }
-                            partial.drain(..advance); idx = 0;
+                    complete_pending(pending.take().unwrap(), &mut metrics, &metrics_tx); } } }
                         }
-                        if partial.len() > 8192 { partial = partial[partial.len()-4096..].to_string(); metrics.partial_buffer_trims +=1; let _ = metrics_tx.send(metrics.clone()); }
+                        partial.drain(..consumed);
+                        if partial.len() > 8192 { partial.drain(..partial.len()-4096); metrics.partial_buffer_trims +=1; let _ = metrics_tx.send(metrics.clone()); }
                     },
                     Ok(_) => {},
                     Err(SerialError::Timeout) => {},
                     Err(e) => { let msg = format!("IO error: {}", e); let _ = events_tx.send(ParsedEvent::ProtocolNotice { message: msg.clone() }); metrics.last_error = Some(msg.clone()); let _ = metrics_tx.send(metrics.clone()); if let Some(p) = pending.take() { let _ = p.responder.send(Err(e)); } break; }
                 }
             },
-            _ = sleep(Duration::from_millis(5)) => { if let Some(p) = pending.as_mut() { if p.started.elapsed() > p.spec.timeout { let p_done = pending.take().unwrap(); metrics.command_timeouts +=1; let _ = metrics_tx.send(metrics.clone());
+            _ = sleep_until(deadline.unwrap_or_else(tokio::time::Instant::now)), if deadline.is_some() => { if let Some(p) = pending.as_mut() {
+                // A command whose matcher was satisfied before its minimum duration completes here once the gate opens,
+                // even if no further line arrives
+                if let Some(min_ms) = p.spec.test_min_duration_ms { if p.spec.matcher.is_complete(&p.buffer) && p.started.elapsed().as_millis() >= min_ms as u128 { complete_pending(pending.take().unwrap(), &mut metrics, &metrics_tx); continue; } }
+                if p.started.elapsed() >= p.spec.timeout { let p_done = pending.take().unwrap(); metrics.command_timeouts +=1; let _ = metrics_tx.send(metrics.clone());
                 // Diagnostic log with partial buffer for troubleshooting timeouts
                 if !p_done.buffer.is_empty() { log::warn!("Command '{}' timeout after {:?}; partial lines: {:?}", p_done.spec.name, p_done.spec.timeout, p_done.buffer); } else { log::warn!("Command '{}' timeout after {:?}; no lines received", p_done.spec.name, p_done.spec.timeout); }
                 let _ = p_done.responder.send(Err(SerialError::Timeout)); } } }
@@ -118,6 +124,22 @@ pub(crate) async fn reader_task(
 }
 
 
+/// Instant at which a pending command next needs attention: its minimum-duration gate opening
+/// (once the matcher is already satisfied) or its timeout, whichever comes first
+fn pending_deadline(p: &PendingCommand) -> tokio::time::Instant {
+    let gate = p.spec.test_min_duration_ms.filter(|_| p.spec.matcher.is_complete(&p.buffer)).map(Duration::from_millis);
+    let wait = gate.map_or(p.spec.timeout, |g| g.min(p.spec.timeout));
+    tokio::time::Instant::from_std(p.started + wait)
+}
+
+/// Deliver a satisfied command's response and fold its latency into the metrics
+fn complete_pending(p_done: PendingCommand, metrics: &mut MetricsSnapshot, metrics_tx: &watch::Sender<MetricsSnapshot>) {
+    let latency_ms = p_done.started.elapsed().as_millis() as u64; metrics.command_completed +=1; metrics.command_last_latency_ms = Some(latency_ms); metrics.command_min_latency_ms = Some(match metrics.command_min_latency_ms { Some(m) => m.min(latency_ms), None => latency_ms }); metrics.command_max_latency_ms = Some(match metrics.command_max_latency_ms { Some(m) => m.max(latency_ms), None => latency_ms }); metrics.command_latency_samples +=1; // update avg
+    metrics.command_avg_latency_ms = Some(match (metrics.command_avg_latency_ms, metrics.command_latency_samples) { (Some(avg), samples) if samples>1 => ((avg * (samples as f64 -1.0)) + latency_ms as f64) / samples as f64, _ => latency_ms as f64 });
+    metrics.command_ema_latency_ms = Some(match metrics.command_ema_latency_ms { Some(prev) => (prev * 0.8) + (latency_ms as f64 * 0.2), None => latency_ms as f64 });
+    let _ = metrics_tx.send(metrics.clone()); let resp = CommandResponse { lines: p_done.buffer, finished_reason: FinishReason::MatcherSatisfied }; let _ = p_done.responder.send(Ok(resp));
+}
+
 fn process_line(
     line: &str,
     events_tx: &broadcast::Sender<ParsedEvent>,
@@ -217,7 +239,7 @@ pub fn test_drive_lines(lines: &[&str], matcher: super::types::ResponseMatcher)
 
 // Test helper with minimum duration
 pub fn test_drive_lines_with_min(lines: &[&str], matcher: super::types::ResponseMatcher, min_ms: u64) -> (usize, bool, u64) {
-    use super::types::{PendingCommand, CommandSpec, CommandResponse, FinishReason, MetricsSnapshot};
+    use super::types::{PendingCommand, CommandSpec, CommandResponse, FinishReason};
     use std::time::{Instant, Duration};
     use tokio::sync::oneshot;
     let (tx, mut rx) = oneshot::channel();
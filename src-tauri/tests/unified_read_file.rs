@@ -1,5 +1,6 @@
 use joycore_x_lib::serial::unified::types::ResponseMatcher;
 use joycore_x_lib::serial::unified::reader::test_drive_lines;
+use joycore_x_lib::serial::file_data::decode_file_data_response;
 
 #[tokio::test]
 async fn test_unified_read_file_matcher() {
@@ -12,4 +13,14 @@ async fn test_unified_read_file_matcher() {
     let (completed, success) = test_drive_lines(&lines, matcher);
     assert_eq!(completed, 1, "Matcher should complete on FILE_DATA line");
     assert!(success, "Response should be delivered");
-}
\ No newline at end of file
+}
+
+#[test]
+fn test_decode_file_data_response() {
+    let bytes = decode_file_data_response("FILE_DATA:/config.bin:4:DEADBEEF").expect("valid payload");
+    assert_eq!(bytes, vec![0xDE, 0xAD, 0xBE, 0xEF]);
+
+    // Size mismatch and malformed headers are rejected
+    assert!(decode_file_data_response("FILE_DATA:/config.bin:5:DEADBEEF").is_err());
+    assert!(decode_file_data_response("FILE_DATA:/config.bin").is_err());
+}